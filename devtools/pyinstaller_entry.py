@@ -0,0 +1,13 @@
+"""Launcher script for the PyInstaller build.
+
+PyInstaller executes the entry script as ``__main__`` with no parent package,
+so pointing the spec straight at ``src/linkhut_cli/cli.py`` breaks its
+relative imports (``from .utils import ...``). This shim uses absolute
+imports only and defers to the same entry point the ``linkhut`` console
+script uses.
+"""
+
+from linkhut_cli.__main__ import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# PyInstaller spec for a directory-mode linkhut binary.
+#
+# Directory mode (--onedir) is deliberate: a --onefile binary self-extracts to
+# /tmp on every invocation, which dwarfs the CLI's actual startup time. The
+# COLLECT output is zipped once for release; users extract it once and run
+# ./linkhut/linkhut directly.
+#
+# Build with: make binary  (or: pyinstaller linkhut.spec)
+
+# The entry script must use absolute imports: PyInstaller runs it as __main__
+# outside any package, so cli.py's relative imports would fail at startup.
+a = Analysis(
+    ["devtools/pyinstaller_entry.py"],
+    pathex=["src"],
+    binaries=[],
+    datas=[],
+    hiddenimports=["linkhut_lib.linkhut_lib"],
+    hookspath=[],
+    runtime_hooks=[],
+    # Stdlib/third-party modules dragged in transitively that the CLI never uses
+    excludes=["test", "unittest", "pydoc", "tkinter", "doctest", "pdb"],
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    exclude_binaries=True,
+    name="linkhut",
+    debug=False,
+    strip=False,
+    upx=False,
+    console=True,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name="linkhut",
+)
@@ -7,4 +7,11 @@ bookmarks, as well as manage tags and reading lists directly from the terminal.
 The CLI is built on top of the LinkHut library and uses Typer for command-line parsing.
 """
 
-__version__ = "0.1.0"
+# The real version lives in git tags (uv-dynamic-versioning), so read it from
+# the installed distribution instead of hardcoding a number that goes stale.
+from importlib.metadata import PackageNotFoundError, version
+
+try:
+    __version__ = version("linkhut-cli")
+except PackageNotFoundError:  # running from a source checkout, not installed
+    __version__ = "0.0.0"
@@ -5,7 +5,9 @@ This module serves as the main entry point for the LinkHut CLI application.
 It handles environment variable checking before launching the application.
 """
 
-from .cli import app, check_env_variables
+import sys
+
+from . import __version__
 
 
 def main():
@@ -18,6 +20,15 @@ def main():
     Returns:
         None
     """
+    # Fast path: --version needs nothing but the package metadata, so answer
+    # it before importing .cli — and with it typer/click — which otherwise
+    # dominates the invocation.
+    if len(sys.argv) >= 2 and sys.argv[1] in ("--version", "-V"):
+        print(__version__)
+        return
+
+    from .cli import app, check_env_variables
+
     check_env_variables()  # Check environment variables before running commands
     app()
 
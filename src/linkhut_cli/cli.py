@@ -14,32 +14,46 @@ import sys
 import time
 from datetime import datetime
 
-import dotenv
 import typer
 from tqdm import tqdm
 
-# Add the parent directory to sys.path to be able to import from linkhut_lib
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-from linkhut_lib.linkhut_lib import (
-    create_bookmark,
-    delete_bookmark,
-    delete_tag,
-    get_bookmarks,
-    get_reading_list,
-    rename_tag,
-    update_bookmark,
-)
-
+# Note: linkhut_lib (and its httpx dependency) is imported lazily inside each
+# command so that invocations which never touch the API (--help, config-status)
+# don't pay the import cost at startup.
 from .utils import parse_bulk_items, sanitize_tags
 
-app = typer.Typer(help="LinkHut CLI - Manage your bookmarks on LinkHut from the command line.")
-bookmarks_app = typer.Typer(help="Manage bookmarks")
-tags_app = typer.Typer(help="Manage tags")
+# pretty_exceptions_enable=False keeps Typer from installing rich's traceback
+# hook (and importing rich) on every invocation — we don't need fancy
+# tracebacks for a short-lived CLI and it saves startup time.
+app = typer.Typer(
+    help="LinkHut CLI - Manage your bookmarks on LinkHut from the command line.",
+    pretty_exceptions_enable=False,
+)
+bookmarks_app = typer.Typer(help="Manage bookmarks", pretty_exceptions_enable=False)
+tags_app = typer.Typer(help="Manage tags", pretty_exceptions_enable=False)
 app.add_typer(bookmarks_app, name="bookmarks")
 app.add_typer(tags_app, name="tags")
 
 
+# Whether the .env file has already been loaded into os.environ this process
+_env_loaded = False
+
+
+def _ensure_env():
+    """Load the .env file once per process.
+
+    The loader is imported lazily and the load is memoized so repeated
+    commands (or sequential subcommand invocations) don't re-import the
+    module or re-parse the .env file.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        from linkhut_lib.env import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
 # Check environment variables on startup
 def check_env_variables():
     """Check if required environment variables are set.
@@ -51,22 +65,35 @@ def check_env_variables():
     Returns:
         bool: True if all required environment variables are set, False otherwise
     """
-    dotenv.load_dotenv()
-    missing: list[str] = []
-    if not os.getenv("LH_PAT"):
-        missing.append("LH_PAT")
-    if not os.getenv("LINK_PREVIEW_API_KEY"):
-        missing.append("LINK_PREVIEW_API_KEY")
-
-    if missing:
-        typer.secho(
-            f"Error: Missing required environment variables: {', '.join(missing)}", fg="red"
-        )
+    # Fast path: in CI/containers the credentials are already in the
+    # environment, so skip the dotenv import and the .env file stat entirely.
+    if os.environ.get("LH_PAT") and os.environ.get("LINK_PREVIEW_API_KEY"):
+        return True
+
+    from linkhut_lib.settings import get_settings
+
+    try:
+        get_settings()
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg="red")
         typer.secho("Please add them to your .env file or set them in your environment", fg="red")
         return False
     return True
 
 
+def _mask(token: str) -> str:
+    """Mask a token, keeping the first and last few characters for verification."""
+    n = len(token)
+    return "****" if n <= 8 else "".join((token[:4], "*" * (n - 8), token[-4:]))
+
+
+# (display label, environment variable, field name) for config-status
+_CREDENTIALS: tuple[tuple[str, str, str], ...] = (
+    ("LinkHut API Token", "LH_PAT", "Token"),
+    ("Link Preview API Key", "LINK_PREVIEW_API_KEY", "API Key"),
+)
+
+
 @app.command()
 def config_status():
     """Check authentication configuration status.
@@ -78,30 +105,98 @@ def config_status():
     Returns:
         None: Results are printed directly to stdout
     """
-    dotenv.load_dotenv()
-    lh_pat = os.getenv("LH_PAT")
-    lp_api_key = os.getenv("LINK_PREVIEW_API_KEY")
+    _ensure_env()
 
     typer.echo("Configuration status:")
 
-    if lh_pat:
-        typer.secho("✅ LinkHut API Token is configured", fg="green")
-        # Show the first few and last few characters of the token
-        masked = lh_pat[:4] + "*" * (len(lh_pat) - 8) + lh_pat[-4:] if len(lh_pat) > 8 else "****"
-        typer.echo(f"   Token: {masked}")
-    else:
-        typer.secho("❌ LinkHut API Token is not configured", fg="red")
-
-    if lp_api_key:
-        typer.secho("✅ Link Preview API Key is configured", fg="green")
-        masked = (
-            lp_api_key[:4] + "*" * (len(lp_api_key) - 8) + lp_api_key[-4:]
-            if len(lp_api_key) > 8
-            else "****"
+    for label, var, field in _CREDENTIALS:
+        token = os.getenv(var)
+        if token:
+            typer.secho(f"✅ {label} is configured", fg="green")
+            typer.echo(f"   {field}: {_mask(token)}")
+        else:
+            typer.secho(f"❌ {label} is not configured", fg="red")
+
+
+# Static completion tables: command -> completable words. Rendering these into
+# a plain shell script once means `linkhut <TAB>` never has to start the Python
+# interpreter (Typer's dynamic completion re-imports the whole CLI per TAB).
+_COMPLETION_WORDS: dict[str, str] = {
+    "bookmarks": "get add update delete",
+    "bookmarks get": "--tag -g --count -c --date -d --url -u",
+    "bookmarks add": "--bulk -b --title -t --note -n --tag -g --private -p --to-read -r --replace -R",
+    "bookmarks update": "--tag -g --note -n --private --public --replace -R",
+    "bookmarks delete": "--force -f",
+    "tags": "rename delete",
+    "tags rename": "",
+    "tags delete": "--force -f",
+    "reading-list": "--count -c --to-read --read --note -n --tag -g",
+    "": "bookmarks tags reading-list config-status install-completion --help",
+}
+
+
+def _render_completion_script() -> str:
+    """Render a static bash/zsh completion script from the command tables."""
+    group_cases: list[str] = []
+    for key, words in _COMPLETION_WORDS.items():
+        if " " in key or not key:
+            continue
+        sub_cases = "".join(
+            f'\n                {sub.split()[1]}) opts="{subwords}" ;;'
+            for sub, subwords in _COMPLETION_WORDS.items()
+            if sub.startswith(f"{key} ")
         )
-        typer.echo(f"   API Key: {masked}")
-    else:
-        typer.secho("❌ Link Preview API Key is not configured", fg="red")
+        if sub_cases:
+            group_cases.append(
+                f'        {key})\n'
+                f'            case "${{COMP_WORDS[2]}}" in{sub_cases}\n'
+                f'                *) opts="{words}" ;;\n'
+                f"            esac ;;"
+            )
+        else:
+            group_cases.append(f'        {key}) opts="{words}" ;;')
+    return (
+        "# Static completion for linkhut. Generated by `linkhut install-completion`.\n"
+        "# Source this file from your shell rc (bash, or zsh after bashcompinit).\n"
+        "_linkhut_complete() {\n"
+        '    local cur opts\n'
+        '    cur="${COMP_WORDS[COMP_CWORD]}"\n'
+        '    case "${COMP_WORDS[1]}" in\n'
+        + "\n".join(group_cases)
+        + f'\n        *) opts="{_COMPLETION_WORDS[""]}" ;;\n'
+        "    esac\n"
+        '    COMPREPLY=( $(compgen -W "${opts}" -- "${cur}") )\n'
+        "}\n"
+        "complete -F _linkhut_complete linkhut\n"
+    )
+
+
+@app.command("install-completion")
+def install_completion_cmd():
+    """Write a static shell-completion script for linkhut.
+
+    Unlike Typer's built-in dynamic completion, the generated script is a plain
+    shell function: pressing TAB completes commands and options without ever
+    starting the Python interpreter. The script is written to
+    ~/.config/linkhut/completion.sh; source it from your shell rc, e.g.
+
+        echo 'source ~/.config/linkhut/completion.sh' >> ~/.bashrc
+    """
+    config_dir = os.path.join(
+        os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")), "linkhut"
+    )
+    os.makedirs(config_dir, exist_ok=True)
+    script_path = os.path.join(config_dir, "completion.sh")
+    with open(script_path, "w") as f:
+        f.write(_render_completion_script())
+
+    typer.secho(f"Completion script written to {script_path}", fg="green")
+    typer.echo("Add the following line to your shell rc file to enable it:")
+    typer.echo(f"    source {script_path}")
+
+
+# Title colors for the listing loop, indexed by the to_read flag
+_TITLE_COLORS: tuple[str, str] = ("white", "bright_white")
 
 
 # Bookmark commands
@@ -137,6 +232,8 @@ def list_bookmarks(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import get_bookmarks
+
     params: dict[str, str | int] = {}
 
     if count:
@@ -177,17 +274,23 @@ def list_bookmarks(
         typer.echo("An error occurred while fetching bookmarks. Issue with network or API.")
         return
 
+    # typer.style only wraps the text in ANSI escapes (no I/O), so the whole
+    # listing is assembled in memory and flushed with a single write instead of
+    # several syscalls per bookmark.
+    parts: list[str] = []
     for i, bookmark in enumerate(fetched_bookmarks, 1):
-        title: str = bookmark.get("description", "No title available")
-        href: str = bookmark.get("href", "No URL")
-        tags: str = bookmark.get("tags", "").replace(" ", ", ")
+        # Single dict lookup per field; `or` covers both missing and empty values
+        title: str = bookmark.get("description") or "No title available"
+        href: str = bookmark.get("href") or "No URL"
+        tags_raw: str | None = bookmark.get("tags")
+        tags: str = tags_raw.replace(" ", ", ") if tags_raw else ""
         is_private: bool = bookmark.get("shared") == "no"
         to_read: bool = bookmark.get("toread") == "yes"
         note: str = bookmark.get("extended", "")
         date_str: str = bookmark.get("time", "No date available")
 
         # Format output with color and indicators
-        title_color: str = "bright_white" if to_read else "white"
+        title_color: str = _TITLE_COLORS[to_read]
         privacy: str = "[private]" if is_private else "[public]"
         read_status: str = "[unread]" if to_read else ""
         status_text: str = f"{privacy} {read_status}"
@@ -195,14 +298,17 @@ def list_bookmarks(
             "%d %B %Y - %I:%M %p"
         )
 
-        typer.secho(f"{i}. {title}", fg=title_color, bold=to_read)
-        typer.secho(f"   URL: {href}", fg="blue")
-        typer.secho(f"   Tags: {tags}", fg="cyan")
-        typer.secho(f"   Date: {date_str} GMT", fg="magenta")
-        typer.secho(f"   Status: {status_text}", fg="yellow")
-        typer.echo("")  # Empty line between bookmarks
+        parts.append(typer.style(f"{i}. {title}", fg=title_color, bold=to_read) + "\n")
+        parts.append(typer.style(f"   URL: {href}", fg="blue") + "\n")
+        parts.append(typer.style(f"   Tags: {tags}", fg="cyan") + "\n")
+        parts.append(typer.style(f"   Date: {date_str} GMT", fg="magenta") + "\n")
+        parts.append(typer.style(f"   Status: {status_text}", fg="yellow") + "\n")
+        parts.append("\n")  # Empty line between bookmarks
         if note:
-            typer.secho(f"   Note: {note}", fg="green")
+            parts.append(typer.style(f"   Note: {note}", fg="green") + "\n")
+
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 
 # todo: #25 remove the bulk argument from add_bookmark and infer if multiple URLs are provided by checking for newlines or commas
@@ -241,6 +347,8 @@ def add_bookmark(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import create_bookmark
+
     if bulk:
         add_bulk_bookmarks(
             urls=url, note=note, tags=tags, private=private, to_read=to_read, replace=replace
@@ -337,6 +445,8 @@ def update_bookmark_cmd(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import update_bookmark
+
     result: dict[str, str] = update_bookmark(
         url=url, new_tag=tags, new_note=note, new_private=private, replace=replace
     )
@@ -391,6 +501,8 @@ def delete_bookmark_cmd(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import delete_bookmark, get_bookmarks
+
     # First fetch the bookmark details to show the user what they're deleting
     bookmark: dict[str, str] = get_bookmarks(url=url)[0]
 
@@ -451,6 +563,8 @@ def rename_tag_cmd(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import rename_tag
+
     result: dict[str, str] = rename_tag(old_tag=old_tag, new_tag=new_tag)
 
     if result.get("error") == "invalid_tag_format":
@@ -483,6 +597,8 @@ def delete_tag_cmd(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import delete_tag
+
     if not force:
         confirmed = typer.confirm(
             f"Are you sure you want to delete the tag '{tag}' from all bookmarks?"
@@ -527,6 +643,8 @@ def reading_list_cmd(
     if not check_env_variables():
         return
 
+    from linkhut_lib.linkhut_lib import get_reading_list, update_bookmark
+
     # If URL is provided, update the bookmark's reading status
     if url:
         result = update_bookmark(url=url, new_tag=tags, new_note=note, new_to_read=to_read)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Long-running daemon for the LinkHut CLI.
+
+Every normal `linkhut` invocation pays the interpreter cold start: importing
+typer, httpx and friends, re-reading .env, and opening a fresh TLS connection.
+This module keeps all of that warm in a background process listening on a Unix
+socket. The matching thin client lives in `linkhut_cli.fast` and only needs
+the stdlib, so repeated invocations skip the import tax entirely.
+
+Protocol: each request/response is a 4-byte big-endian length prefix followed
+by a JSON object. Requests look like `{"cmd": "list", "args": {...}}`;
+responses are `{"result": <json>}` or `{"error": "<message>"}`.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+from typing import Any
+
+
+def socket_path() -> str:
+    """Return the path of the daemon's Unix socket."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "linkhut.sock")
+    return f"/tmp/linkhut-{os.getuid()}.sock"
+
+
+def recv_message(conn: socket.socket) -> dict[str, Any] | None:
+    """Read one length-prefixed JSON message, or None if the peer hung up."""
+    header = _recv_exact(conn, 4)
+    if header is None:
+        return None
+    (length,) = struct.unpack(">I", header)
+    body = _recv_exact(conn, length)
+    if body is None:
+        return None
+    return json.loads(body)
+
+
+def send_message(conn: socket.socket, message: dict[str, Any]) -> None:
+    """Send one length-prefixed JSON message."""
+    body = json.dumps(message).encode()
+    conn.sendall(struct.pack(">I", len(body)) + body)
+
+
+def _recv_exact(conn: socket.socket, n: int) -> bytes | None:
+    chunks: list[bytes] = []
+    remaining = n
+    while remaining:
+        chunk = conn.recv(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _dispatch(cmd: str, args: dict[str, Any]) -> dict[str, str] | list[dict[str, str]]:
+    """Map a protocol command onto the corresponding linkhut_lib function."""
+    # Imported here (not at module top) so the fast client can import the
+    # protocol helpers above without dragging in httpx.
+    from linkhut_lib.linkhut_lib import (
+        create_bookmark,
+        delete_bookmark,
+        delete_tag,
+        get_bookmarks,
+        get_reading_list,
+        rename_tag,
+        update_bookmark,
+    )
+
+    commands = {
+        "get": get_bookmarks,
+        "add": create_bookmark,
+        "update": update_bookmark,
+        "delete": delete_bookmark,
+        "reading-list": get_reading_list,
+        "rename-tag": rename_tag,
+        "delete-tag": delete_tag,
+    }
+    if cmd not in commands:
+        raise ValueError(f"Unknown command: {cmd}")
+    return commands[cmd](**args)
+
+
+def serve() -> None:
+    """Accept and answer client requests until told to stop."""
+    path = socket_path()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    os.chmod(path, 0o600)  # the socket carries authenticated API access
+    server.listen(5)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            # A misbehaving client (malformed JSON, mid-write hangup) must not
+            # take down the daemon — the warm state is the whole point. Only
+            # an explicit stop command exits the loop.
+            with conn:
+                try:
+                    request = recv_message(conn)
+                    if request is None:
+                        continue
+                    cmd = request.get("cmd", "")
+                    if cmd == "stop":
+                        send_message(conn, {"result": "stopping"})
+                        return
+                    if cmd == "ping":
+                        send_message(conn, {"result": "pong"})
+                        continue
+                    try:
+                        result = _dispatch(cmd, request.get("args", {}))
+                        send_message(conn, {"result": result})
+                    except Exception as e:
+                        send_message(conn, {"error": str(e)})
+                except Exception as e:
+                    print(f"linkhutd: dropping bad connection: {e}", file=sys.stderr)
+    finally:
+        server.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def main() -> None:
+    """Entry point for the `linkhutd` console script."""
+    serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Thin stdlib-only client for the LinkHut daemon.
+
+This is the fast path for repeated invocations: it imports nothing but the
+stdlib (no typer, no httpx), forwards the command line to the `linkhutd`
+daemon over a Unix socket, and prints the JSON result. The daemon is spawned
+automatically on first use, so `linkhut-fast` can be used as a drop-in for
+scripting loops where `linkhut`'s cold start dominates.
+
+Usage:
+    linkhut-fast <cmd> [key=value ...]
+    linkhut-fast get tag=python count=5
+    linkhut-fast stop
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+
+from .daemon import recv_message, send_message, socket_path
+
+
+def _connect() -> socket.socket:
+    """Connect to the daemon, spawning it first if it isn't running."""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path())
+        return conn
+    except OSError:
+        conn.close()
+
+    _spawn_daemon()
+    # Give the daemon a moment to bind its socket
+    for _ in range(50):
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(socket_path())
+            return conn
+        except OSError:
+            conn.close()
+            time.sleep(0.1)
+    sys.exit("error: could not start the linkhut daemon")
+
+
+def _spawn_daemon() -> None:
+    """Fork a detached daemon process running linkhut_cli.daemon."""
+    if os.fork() != 0:
+        return
+    # Child: detach from the terminal and replace ourselves with the daemon
+    os.setsid()
+    if os.fork() != 0:  # double-fork so the daemon is reparented to init
+        os._exit(0)
+    os.execv(sys.executable, [sys.executable, "-m", "linkhut_cli.daemon"])
+
+
+def _parse_args(argv: list[str]) -> tuple[str, dict[str, object]]:
+    """Split argv into the command name and key=value arguments."""
+    if not argv:
+        sys.exit(__doc__.strip())
+    cmd = argv[0]
+    args: dict[str, object] = {}
+    for item in argv[1:]:
+        key, sep, value = item.partition("=")
+        if not sep:
+            sys.exit(f"error: expected key=value, got {item!r}")
+        # Pass ints and bools through with their natural types
+        if value.isdigit():
+            args[key] = int(value)
+        elif value in ("true", "false"):
+            args[key] = value == "true"
+        else:
+            args[key] = value
+    return cmd, args
+
+
+def main() -> None:
+    """Entry point for the `linkhut-fast` console script."""
+    cmd, args = _parse_args(sys.argv[1:])
+    with _connect() as conn:
+        send_message(conn, {"cmd": cmd, "args": args})
+        response = recv_message(conn)
+
+    if response is None:
+        sys.exit("error: daemon closed the connection")
+    if "error" in response:
+        sys.exit(f"error: {response['error']}")
+    print(json.dumps(response["result"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,9 @@ The actual API keys are inserted into these templates at runtime.
 # from enum import Enum
 # from typing import TypeAlias
 
+from functools import lru_cache
+
 # LinkHut API configuration
-LINKHUT_HEADER: dict[str, str] = {
-    "Accept": "application/json",
-    "Authorization": "Bearer {PAT}",  # PAT placeholder replaced at runtime
-}
 LINKHUT_BASEURL: str = "https://api.ln.ht"
 
 # LinkHut API endpoints
@@ -29,7 +27,18 @@ LINKHUT_API_ENDPOINTS: dict[str, str] = {
 
 
 # LinkPreview API configuration
-LINKPREVIEW_HEADER: dict[str, str] = {
-    "X-Linkpreview-Api-Key": "{API_KEY}"  # API_KEY placeholder replaced at runtime
-}
 LINKPREVIEW_BASEURL: str = "https://api.linkpreview.net"
+
+
+# The credential is interpolated once and the resulting dict cached, so per-call
+# header construction (copy + str.format) stays off the request hot path.
+@lru_cache(maxsize=1)
+def build_linkhut_header(pat: str) -> dict[str, str]:
+    """Build the LinkHut request headers for the given personal access token."""
+    return {"Accept": "application/json", "Authorization": f"Bearer {pat}"}
+
+
+@lru_cache(maxsize=1)
+def build_linkpreview_header(api_key: str) -> dict[str, str]:
+    """Build the LinkPreview request headers for the given API key."""
+    return {"X-Linkpreview-Api-Key": api_key}
@@ -0,0 +1,50 @@
+"""Minimal .env loader.
+
+The project only ever used `dotenv.load_dotenv()` with default arguments, so
+this replaces the python-dotenv dependency (and its import cost) with a small
+parser: KEY=VALUE lines, `#` comments, optional surrounding quotes. Existing
+environment variables are never overridden, matching python-dotenv's default.
+"""
+
+import os
+
+# Paths already loaded this process, so repeated calls don't re-read the file
+_loaded: set[str] = set()
+
+
+def load_dotenv(path: str = ".env") -> None:
+    """Load variables from a .env file into os.environ, once per path.
+
+    Args:
+        path (str): Path to the .env file (default: ".env" in the CWD).
+    """
+    if path in _loaded:
+        return
+    _loaded.add(path)
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        # shell-style `export KEY=VALUE` lines are common in reused .env files
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+        key, _, value = line.partition("=")
+        value = value.strip()
+        closing = value.find(value[0], 1) if value[:1] in "\"'" else -1
+        if closing != -1:
+            # quoted: contents kept verbatim (including '#'); anything after
+            # the closing quote — typically an inline comment — is dropped
+            value = value[1:closing]
+        else:
+            # unquoted: a '#' preceded by whitespace starts an inline comment
+            comment = value.find(" #")
+            if comment != -1:
+                value = value[:comment].rstrip()
+        os.environ.setdefault(key.strip(), value)
@@ -7,20 +7,23 @@ including creating, updating, listing and deleting bookmarks, as well as managin
 
 # todo: standardize error codes and messages across all functions
 
+import asyncio
 import json
-import sys
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+import httpx
 from httpx import Response
 from loguru import logger
 
 from . import utils
 
-logger.remove()
-logger.add(
-    sys.stderr,
-    level="ERROR",
-    format="<green>{time:YYYY-MM-DD at HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-)
+utils.configure_logging()
+
+# Payload for the no-argument get_bookmarks call; linkhut_api_call only reads
+# the payload, so the constant can be shared across calls without copying
+_DEFAULT_RECENT: dict[str, str] = {"count": "15"}
 
 
 def get_bookmarks(
@@ -84,17 +87,20 @@ def get_bookmarks(
     else:
         # Default behavior: get recent 15 posts
         action = "bookmark_recent"
-        fields["count"] = "15"
+        fields = _DEFAULT_RECENT
 
     try:
         response: Response = utils.linkhut_api_call(action=action, payload=fields)
-        fetched_bookmarks: list[dict[str, str]] = response.json().get("posts", [])
+        # the posts payload nests lists under string keys, so dict[str, str]
+        # would reject the .get("posts") narrowing below
+        response_dict: dict[str, Any] = utils.decode_response(response)
+        fetched_bookmarks: list[dict[str, str]] = response_dict.get("posts", [])
 
         # if bookmarks are found, posts list will not be empty
         if fetched_bookmarks:
             logger.debug("Bookmarks fetched successfully")
             return fetched_bookmarks
-        elif response.json().get("result_code") == "something went wrong" or not fetched_bookmarks:
+        elif response_dict.get("result_code") == "something went wrong" or not fetched_bookmarks:
             # result code "something went wrong" indicates posts/get endpoint was called with wrong url
             # todo: update logger error class severity equal to debug
             logger.warning("No Bookmarks Found")
@@ -146,17 +152,28 @@ def create_bookmark(
 
     action = "bookmark_create"
 
-    # If title not provided, try to fetch it
-    if not title:
+    need_title: bool = not title
+    need_tags: bool = not tags.isalnum() and fetch_tags
+
+    # The two enrichment fetches hit different services and are independent,
+    # so when both are needed they run concurrently instead of back to back
+    if need_title and need_tags:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            title_future = pool.submit(utils.get_link_title, url)
+            tags_future = pool.submit(utils.get_tags_suggestion, url)
+            title = title_future.result()
+            # convert comma separated tags to + separated tags
+            tags = tags_future.result().replace(",", " ").replace(" ", "+")
+    elif need_title:
+        # If title not provided, try to fetch it
         title = utils.get_link_title(url)
-
-    # If valid tags not provided, try to fetch suggestions
-    if not tags.isalnum() and fetch_tags:
+    elif need_tags:
+        # If valid tags not provided, try to fetch suggestions
         tags_str: str = utils.get_tags_suggestion(url)  # comma separated tags
         tags = tags_str.replace(",", " ").replace(" ", "+")  # convert to + separated tags
 
     # checks if tag string in argument is not just a whitespace or empty string
-    elif tags.isalnum():
+    if not need_tags and tags.isalnum():
         _tag_list: list[str] = tags.replace(",", " ").split()
         tags = "+".join(_tag_list)
 
@@ -174,7 +191,7 @@ def create_bookmark(
 
     try:
         response: Response = utils.linkhut_api_call(action=action, payload=fields)
-        response_dict: dict[str, str] = response.json()
+        response_dict: dict[str, str] = utils.decode_response(response)
         status_code: int = response.status_code
         if status_code == 200 and response_dict.get("result_code") == "done":
             logger.debug(f"Bookmark created successfully: {response_dict}")
@@ -194,6 +211,7 @@ def update_bookmark(
     new_private: bool | None = None,
     new_to_read: bool | None = None,
     replace: bool = False,  # whether to replace data or append to existing data
+    force: bool = False,  # skip the existence check and overwrite unconditionally
 ) -> dict[str, str]:
     """
     Update an existing bookmark or create a new one if it doesn't exist.
@@ -209,6 +227,10 @@ def update_bookmark(
         new_private (str): Whether to set the bookmark as private ("yes") or public ("no")
         to_read (bool | None): Whether to mark as to-read (True) or read (False). None means no change.
         replace (bool): Whether to replace existing data or append to it
+        force (bool): Skip the existence GET and write the provided values directly,
+            so each bookmark costs exactly one LinkHut call. Destructive: every
+            field is overwritten — the description becomes the URL itself and any
+            tags/notes not passed here are cleared.
 
     Returns:
         dict[str, str]: Status information about the update operation
@@ -219,6 +241,23 @@ def update_bookmark(
         logger.debug("No updates provided. Nothing to do.")
         return {"status": "missing_update_parameters"}
 
+    # Fast path: the caller doesn't need the current state, so skip the
+    # existence GET and set the bookmark unconditionally (add is idempotent
+    # with replace=yes)
+    if force:
+        # title=url keeps create_bookmark from fetching one via LinkPreview —
+        # that hidden second round-trip is exactly what force promises to avoid
+        return create_bookmark(
+            url=url,
+            title=url,
+            tags=new_tag,
+            note=new_note,
+            private=new_private if new_private is not None else False,
+            to_read=new_to_read if new_to_read is not None else False,
+            replace=True,
+            fetch_tags=False,
+        )
+
     fields_to_inherit: set[str] = {"description", "tags", "extended", "shared", "toread"}
 
     # check for existing bookmark with the given URL
@@ -318,13 +357,116 @@ def get_reading_list(count: int = 5) -> list[dict[str, str]]:
         logger.info("No bookmarks found in the reading list.")
         return [{"error": "no_bookmarks_found"}]
     elif reading_list:
-        logger.debug(f"Reading list fetched successfully: {json.dumps(reading_list, indent=2)}")
+        logger.opt(lazy=True).debug(
+            "Reading list fetched successfully: {posts}",
+            posts=lambda: json.dumps(reading_list, indent=2),
+        )
         return reading_list
     else:
         logger.error("No bookmarks found in the reading list.")
         return [{"error": "api_error"}]
 
 
+# Concurrent batches share one connection pool; the semaphore caps in-flight
+# requests so bulk operations stay under LinkHut's rate limits.
+_BATCH_CONCURRENCY: int = 10
+
+
+async def _gather_batch(
+    urls: list[str], tasks: list[Coroutine[Any, Any, dict[str, str]]]
+) -> list[dict[str, str]]:
+    """
+    Run a batch of per-URL tasks, surviving partial failure.
+
+    One failed request must not cancel the rest of the batch, so exceptions
+    are collected (return_exceptions=True) and converted into the same
+    per-URL error dictionaries the tasks themselves return.
+
+    Args:
+        urls (list[str]): URLs corresponding to the tasks, in order.
+        tasks (list): Coroutines producing per-URL result dictionaries.
+
+    Returns:
+        list[dict[str, str]]: Per-URL results, in input order.
+    """
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    output: list[dict[str, str]] = []
+    failed: list[str] = []
+    for url, result in zip(urls, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(f"Batch request for {url} failed: {result}")
+            output.append({"url": url, "error": "api_error"})
+            failed.append(url)
+        else:
+            output.append(result)
+
+    if failed:
+        logger.warning(f"{len(failed)}/{len(urls)} batch requests failed: {', '.join(failed)}")
+    return output
+
+
+async def _toggle_read_async(
+    client: httpx.AsyncClient, url: str, to_read: bool, sem: asyncio.Semaphore
+) -> dict[str, str]:
+    """
+    Fetch one bookmark and re-add it with the desired to-read status.
+
+    Args:
+        client (httpx.AsyncClient): Shared client for the batch.
+        url (str): URL of the bookmark to toggle.
+        to_read (bool): Desired to-read status.
+        sem (asyncio.Semaphore): Concurrency cap shared by the batch.
+
+    Returns:
+        dict[str, str]: The updated bookmark fields, or an error dictionary.
+    """
+    async with sem:
+        response = await utils.linkhut_api_call_async(client, "bookmark_get", {"url": url})
+        posts: list[dict[str, str]] = utils.decode_response(response).get("posts", [])
+        if not posts:
+            logger.warning(f"No bookmark found for URL {url}. Skipping toggle.")
+            return {"url": url, "error": "no_bookmarks_found"}
+
+        post = posts[0]
+        fields: dict[str, str] = {
+            "url": url,
+            "description": post.get("description", url),
+            "tags": post.get("tags", "").replace(" ", "+"),
+            "extended": post.get("extended", ""),
+            "shared": post.get("shared", "yes"),
+            "toread": "yes" if to_read else "no",
+            "replace": "yes",
+        }
+        await utils.linkhut_api_call_async(client, "bookmark_create", fields)
+        return fields
+
+
+def bulk_toggle(urls: list[str], to_read: bool = True) -> list[dict[str, str]]:
+    """
+    Set the to-read status of many bookmarks concurrently.
+
+    All URLs are processed in parallel over a shared connection pool (capped
+    at 10 in-flight requests), so a batch costs roughly one round-trip pair
+    instead of one per URL.
+
+    Args:
+        urls (list[str]): URLs of the bookmarks to update.
+        to_read (bool): Whether to mark as to-read (True) or read (False).
+
+    Returns:
+        list[dict[str, str]]: Per-URL result dictionaries, in input order.
+    """
+
+    async def _run() -> list[dict[str, str]]:
+        sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        async with utils.make_async_client() as client:
+            tasks = [_toggle_read_async(client, url, to_read, sem) for url in urls]
+            return await _gather_batch(urls, tasks)
+
+    return asyncio.run(_run())
+
+
 def delete_bookmark(url: str) -> dict[str, str]:
     """
     Delete a bookmark.
@@ -349,7 +491,7 @@ def delete_bookmark(url: str) -> dict[str, str]:
         logger.error(f"Error deleting bookmark: {e}")
         return {"error": "api_error"}
 
-    result_code: str = response.json().get("result_code", "")
+    result_code: str = utils.decode_response(response).get("result_code", "")
 
     if result_code == "done":
         logger.debug(f"Bookmark with URL {url} successfully deleted.")
@@ -359,6 +501,65 @@ def delete_bookmark(url: str) -> dict[str, str]:
         return {"bookmark_deletion": "failure"}
 
 
+async def _delete_bookmark_async(
+    client: httpx.AsyncClient, url: str, sem: asyncio.Semaphore
+) -> dict[str, str]:
+    """
+    Delete one bookmark on a shared client, mirroring delete_bookmark's results.
+
+    Args:
+        client (httpx.AsyncClient): Shared client for the batch.
+        url (str): URL of the bookmark to delete.
+        sem (asyncio.Semaphore): Concurrency cap shared by the batch.
+
+    Returns:
+        dict[str, str]: The per-URL deletion status or error dictionary.
+    """
+    async with sem:
+        try:
+            utils.verify_url(url)
+            response = await utils.linkhut_api_call_async(client, "bookmark_delete", {"url": url})
+        except ValueError as e:
+            logger.error(f"Invalid URL format: {url}. Error: {e}")
+            return {"url": url, "error": "invalid_url_format"}
+        except Exception as e:
+            logger.error(f"Error deleting bookmark: {e}")
+            return {"url": url, "error": "api_error"}
+
+    result_code: str = utils.decode_response(response).get("result_code", "")
+
+    if result_code == "done":
+        logger.debug(f"Bookmark with URL {url} successfully deleted.")
+        return {"url": url, "bookmark_deletion": "success"}
+    else:
+        logger.error(f"Unable to delete bookmark with URL {url}. Result code: {result_code}")
+        return {"url": url, "bookmark_deletion": "failure"}
+
+
+def delete_bookmarks(urls: list[str]) -> list[dict[str, str]]:
+    """
+    Delete many bookmarks concurrently.
+
+    All deletions share one connection pool and run in parallel (capped at 10
+    in-flight requests), so a batch costs roughly one round-trip instead of
+    one per URL.
+
+    Args:
+        urls (list[str]): URLs of the bookmarks to delete.
+
+    Returns:
+        list[dict[str, str]]: Per-URL status dictionaries, in input order.
+    """
+
+    async def _run() -> list[dict[str, str]]:
+        sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        async with utils.make_async_client() as client:
+            tasks = [_delete_bookmark_async(client, url, sem) for url in urls]
+            return await _gather_batch(urls, tasks)
+
+    return asyncio.run(_run())
+
+
 def rename_tag(old_tag: str, new_tag: str) -> dict[str, str]:
     """
     Rename a tag across all bookmarks.
@@ -385,7 +586,7 @@ def rename_tag(old_tag: str, new_tag: str) -> dict[str, str]:
         logger.error(f"Error renaming tag: {e}")
         return {"error": "api_error"}
 
-    result_code: str = response.json().get("result_code", "")
+    result_code: str = utils.decode_response(response).get("result_code", "")
 
     if result_code == "done":
         logger.info(f"Tag '{old_tag}' successfully renamed to '{new_tag}'.")
@@ -421,7 +622,7 @@ def delete_tag(tag: str) -> dict[str, str]:
         logger.error(f"Error deleting tag: {e}")
         return {"error": "api_error"}
 
-    result_code: str = response.json().get("result_code", "")
+    result_code: str = utils.decode_response(response).get("result_code", "")
 
     if result_code == "done":
         logger.debug(f"Tag '{tag}' successfully deleted.")
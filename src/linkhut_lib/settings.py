@@ -0,0 +1,49 @@
+"""Typed, cached runtime settings.
+
+Replaces ad-hoc os.getenv string checks scattered across the CLI with a single
+frozen settings object that is built once per process. Callers get typed
+attribute access to the credentials, and validation happens in exactly one
+place — important for daemon mode, where the same process serves many
+commands.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .env import load_dotenv
+
+# Environment variables the CLI cannot operate without
+_REQUIRED_VARS: tuple[str, ...] = ("LH_PAT", "LINK_PREVIEW_API_KEY")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Credentials required by the LinkHut and LinkPreview APIs."""
+
+    lh_pat: str
+    link_preview_api_key: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load and validate settings, once per process.
+
+    Loads the .env file (if present), validates that all required variables
+    are set, and caches the resulting Settings so subsequent calls are free.
+
+    Returns:
+        Settings: The validated, immutable settings object.
+
+    Raises:
+        ValueError: If any required environment variable is missing, listing
+            all missing names in the message.
+    """
+    load_dotenv()
+    missing: list[str] = [name for name in _REQUIRED_VARS if not os.getenv(name)]
+    if missing:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+    return Settings(
+        lh_pat=os.environ["LH_PAT"],
+        link_preview_api_key=os.environ["LINK_PREVIEW_API_KEY"],
+    )
@@ -1,57 +1,133 @@
 # note: make the order of the return types of functions with api calls consistent.
 # i.e. all the functions which call make_get_request should use `return response.json(), response.status_code`
 
+import atexit
+import functools
 import json
 import os
 import re
 import sys
-from typing import Literal
+import urllib.parse
+from typing import Any, Literal
 
 import httpx
-from dotenv import load_dotenv
+import orjson
 from loguru import logger
 
 from .config import (
     LINKHUT_API_ENDPOINTS,
     LINKHUT_BASEURL,
-    LINKHUT_HEADER,
     LINKPREVIEW_BASEURL,
-    LINKPREVIEW_HEADER,
+    build_linkhut_header,
+    build_linkpreview_header,
 )
+from .env import load_dotenv
 
-logger.remove()
-logger.add(
-    sys.stderr,
-    level="INFO",
-    format="<green>{time:YYYY-MM-DD at HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-)
+# Guard so repeated imports (utils, linkhut_lib) install the handler only once
+_log_configured: bool = False
 
 
-def get_request_headers(site: Literal["LinkHut", "LinkPreview"]) -> dict[str, str]:
+def configure_logging() -> None:
+    """
+    Install the loguru handler once per process.
+
+    The level comes from the LOG_LEVEL environment variable (default ERROR,
+    matching the CLI's previous behavior), so debug logging is opt-in instead
+    of re-installed by every module import.
     """
-    Load the PAT from environment variables and return the request headers.
+    global _log_configured
+    if _log_configured:
+        return
+    _log_configured = True
+
+    level: str = os.getenv("LOG_LEVEL", "ERROR").upper()
+
+    # {name}:{function}:{line} costs a frame walk per record — only worth
+    # paying when actively debugging
+    if level == "DEBUG":
+        fmt = "<green>{time:YYYY-MM-DD at HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+    else:
+        fmt = "<green>{time:YYYY-MM-DD at HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+
+    logger.remove()
+    logger.add(sys.stderr, level=level, format=fmt)
+
+
+configure_logging()
+
+
+def decode_response(response: httpx.Response) -> Any:
     """
-    load_dotenv()  # Load environment variables from .env file
+    Decode a JSON API response body.
+
+    Uses orjson instead of httpx's stdlib-json .json() — noticeably faster for
+    large bookmark listings, identical output types.
+
+    Args:
+        response (httpx.Response): The response to decode.
+
+    Returns:
+        The decoded JSON payload (dict or list).
+    """
+    return orjson.loads(response.content)
+
+
+# Shared HTTP client, created lazily on first request. Reusing one client keeps
+# connections alive between calls, so sequential API calls (update, bulk add)
+# skip the TCP/TLS handshake that a bare httpx.get pays every time.
+_client: httpx.Client | None = None
+
+
+def get_client() -> httpx.Client:
+    """Return the shared httpx.Client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def make_async_client() -> httpx.AsyncClient:
+    """Create an AsyncClient for one batch, configured like the shared client.
+
+    With HTTP/2 the whole batch multiplexes over a single TCP+TLS connection,
+    so N concurrent requests pay one handshake total. A fresh client per batch
+    is deliberate: AsyncClients are bound to the running event loop, so a
+    module-level instance would break across asyncio.run calls.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
 
+
+# Load environment variables from .env once at import; the per-site header
+# dict is then cached so API calls skip the env lookups entirely.
+load_dotenv()
+
+
+@functools.lru_cache(maxsize=2)
+def get_request_headers(site: Literal["LinkHut", "LinkPreview"]) -> dict[str, str]:
+    """
+    Return the request headers for the given site, cached per site.
+    """
     if site == "LinkHut":
         pat: str | None = os.getenv("LH_PAT")
         if not pat:
             raise ValueError("Error: LH_PAT environment variable not set.")
-        header: dict[str, str] = LINKHUT_HEADER
-        # Create a copy of the header and format the PAT into it
-        request_headers: dict[str, str] = header.copy()
-        request_headers["Authorization"] = request_headers["Authorization"].format(PAT=pat)
+        # Built once per token and cached, no dict copy or format per call
+        request_headers: dict[str, str] = build_linkhut_header(pat)
 
     elif site == "LinkPreview":
         pat: str | None = os.getenv("LINK_PREVIEW_API_KEY")
         if not pat:
             raise ValueError("Error: LP_API_KEY environment variable not set.")
-        header: dict[str, str] = LINKPREVIEW_HEADER
-        # Create a copy of the header and format the PAT into it
-        request_headers: dict[str, str] = header.copy()
-        request_headers["X-Linkpreview-Api-Key"] = request_headers["X-Linkpreview-Api-Key"].format(
-            API_KEY=pat
-        )
+        request_headers: dict[str, str] = build_linkpreview_header(pat)
 
     # logger.debug(f"header for {site} is {request_headers}")
     return request_headers
@@ -75,9 +151,12 @@ def make_get_request(url: str, header: dict[str, str]) -> httpx.Response:
     """
     try:
         logger.debug(f"making get request to following url: {url}")
-        response = httpx.get(url=url, headers=header)
-        logger.debug(
-            f"response is {json.dumps(response.json(), indent=2)} with status code {response.status_code}"
+        response = get_client().get(url=url, headers=header)
+        # lazy=True defers the json.dumps until a DEBUG sink actually wants it
+        logger.opt(lazy=True).debug(
+            "response is {body} with status code {code}",
+            body=lambda: json.dumps(decode_response(response), indent=2),
+            code=lambda: response.status_code,
         )
         return response  # Ensure a response is always returned
 
@@ -108,13 +187,11 @@ def linkhut_api_call(action: str, payload: dict[str, str]) -> httpx.Response:
     # calling functions will define how to handle the exception and the replacement values to use if http request fails.
     url: str = LINKHUT_BASEURL + LINKHUT_API_ENDPOINTS[action]
 
-    # Add query parameters if provided
+    # Add query parameters if provided; urlencode percent-encodes values
+    # (spaces, unicode, '&') that the previous hand-built string passed raw.
+    # '+' stays safe because callers already use it as the tag separator.
     if payload:
-        url += "?"
-        params: list[str] = []
-        for key, value in payload.items():
-            params.append(f"{key}={value}")
-        url += "&".join(params)
+        url += "?" + urllib.parse.urlencode(payload, safe="+")
 
     header: dict[str, str] = get_request_headers(site="LinkHut")
     logger.debug(f"making request to {url} with header {header}")
@@ -122,6 +199,37 @@ def linkhut_api_call(action: str, payload: dict[str, str]) -> httpx.Response:
     return response
 
 
+async def linkhut_api_call_async(
+    client: httpx.AsyncClient, action: str, payload: dict[str, str]
+) -> httpx.Response:
+    """
+    Async counterpart of linkhut_api_call, for concurrent batch operations.
+
+    The caller owns the AsyncClient (typically one `async with` block per
+    batch) so all requests in the batch share its connection pool.
+
+    Args:
+        client (httpx.AsyncClient): The client to issue the request on.
+        action (str): The API action to perform (e.g., "bookmark_create")
+        payload (dict[str, str]): Query parameters for the request
+
+    Returns:
+        Response: The response object from the API
+    """
+    url: str = LINKHUT_BASEURL + LINKHUT_API_ENDPOINTS[action]
+
+    # Add query parameters if provided
+    if payload:
+        url += "?" + urllib.parse.urlencode(payload, safe="+")
+
+    header: dict[str, str] = get_request_headers(site="LinkHut")
+    logger.debug(f"making async request to {url}")
+    return await client.get(url, headers=header)
+
+
+# Memoized by URL: retries and update flows re-request the same metadata, and
+# each cache hit saves a full external HTTP round-trip.
+@functools.lru_cache(maxsize=512)
 def get_link_title(dest_url: str) -> str:
     """
     Fetch the title of a link using the LinkPreview API.
@@ -152,7 +260,7 @@ def get_link_title(dest_url: str) -> str:
 
     try:
         response: httpx.Response = make_get_request(url=request_url, header=header)
-        title_str: str = response.json().get("title", "")
+        title_str: str = decode_response(response).get("title", "")
         title = title_str if title_str else dest_url
     except Exception as e:
         logger.error(f"Error fetching the title for {dest_url}: {e}")
@@ -162,6 +270,7 @@ def get_link_title(dest_url: str) -> str:
     return title
 
 
+@functools.lru_cache(maxsize=512)
 def get_tags_suggestion(dest_url: str) -> str:
     """
     Fetch tags suggestion for a link using the LinkHut API.
@@ -186,7 +295,7 @@ def get_tags_suggestion(dest_url: str) -> str:
         # if no tags are found, it will return an empty dict.
 
         status_code: int = response.status_code
-        response_dict: list[dict[str, list[str]]] = response.json()
+        response_dict: list[dict[str, list[str]]] = decode_response(response)
 
         if status_code == 200:
             tag_list: list[str] = response_dict[0]["popular"] + response_dict[1]["recommended"]
@@ -214,14 +323,9 @@ def encode_url(url: str) -> str:
     Returns:
         str: The encoded URL.
     """
-    return (
-        url.replace(":", "%3A")
-        .replace("/", "%2F")
-        .replace("?", "%3F")
-        .replace("&", "%26")
-        .replace("=", "%3D")
-        .replace("\\", "%5C")
-    )
+    # Single C-level pass with full RFC 3986 coverage (spaces, '#', '+',
+    # unicode) instead of six chained .replace copies of the string.
+    return urllib.parse.quote(url, safe="")
 
 
 def verify_url(url: str) -> bool:
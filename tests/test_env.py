@@ -0,0 +1,86 @@
+"""Tests for the minimal .env parser in linkhut_lib.env."""
+
+import os
+
+from linkhut_lib.env import load_dotenv
+
+
+def _load(tmp_path, monkeypatch, content: str, key: str) -> str | None:
+    """Write content to a fresh .env file, load it, and return the parsed value."""
+    monkeypatch.delenv(key, raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text(content, encoding="utf-8")
+    load_dotenv(str(env_file))
+    value = os.environ.get(key)
+    monkeypatch.delenv(key, raising=False)
+    return value
+
+
+def test_basic_assignment(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, "LH_PAT=abc123\n", "LH_PAT") == "abc123"
+
+
+def test_whitespace_around_key_and_value(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, "  LH_PAT  =  abc123  \n", "LH_PAT") == "abc123"
+
+
+def test_quoted_value_keeps_spaces(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, 'LH_PAT="abc 123"\n', "LH_PAT") == "abc 123"
+
+
+def test_single_quoted_value(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, "LH_PAT='abc123'\n", "LH_PAT") == "abc123"
+
+
+def test_unquoted_inline_comment_is_stripped(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, "LH_PAT=abc123  # work token\n", "LH_PAT") == "abc123"
+
+
+def test_quoted_value_keeps_hash(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, 'LH_PAT="abc#123"\n', "LH_PAT") == "abc#123"
+
+
+def test_hash_without_space_is_part_of_value(tmp_path, monkeypatch):
+    # URLs and tokens can contain '#'; only ' #' starts an inline comment
+    assert _load(tmp_path, monkeypatch, "LH_PAT=abc#123\n", "LH_PAT") == "abc#123"
+
+
+def test_quoted_value_with_inline_comment(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, 'LH_PAT="va l" # comment\n', "LH_PAT") == "va l"
+
+
+def test_quoted_value_with_spaced_hash_inside(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, 'LH_PAT="abc # def"\n', "LH_PAT") == "abc # def"
+
+
+def test_export_prefix(tmp_path, monkeypatch):
+    assert _load(tmp_path, monkeypatch, "export LH_PAT=abc123\n", "LH_PAT") == "abc123"
+
+
+def test_comment_and_blank_lines_skipped(tmp_path, monkeypatch):
+    content = "# a comment\n\nLH_PAT=abc123\n"
+    assert _load(tmp_path, monkeypatch, content, "LH_PAT") == "abc123"
+
+
+def test_existing_environ_not_overridden(tmp_path, monkeypatch):
+    monkeypatch.setenv("LH_PAT", "already-set")
+    env_file = tmp_path / ".env"
+    env_file.write_text("LH_PAT=from-file\n", encoding="utf-8")
+    load_dotenv(str(env_file))
+    assert os.environ["LH_PAT"] == "already-set"
+
+
+def test_missing_file_is_silent(tmp_path):
+    load_dotenv(str(tmp_path / "does-not-exist.env"))
+
+
+def test_file_read_once_per_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("LH_PAT", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("LH_PAT=first\n", encoding="utf-8")
+    load_dotenv(str(env_file))
+    assert os.environ.pop("LH_PAT") == "first"
+    # Second call for the same path must not re-read the (changed) file
+    env_file.write_text("LH_PAT=second\n", encoding="utf-8")
+    load_dotenv(str(env_file))
+    assert os.environ.get("LH_PAT") is None